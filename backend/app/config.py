@@ -3,7 +3,7 @@ Configuration settings for AI Red-Teaming Toolkit
 File: backend/app/config.py
 """
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List
 from functools import lru_cache
 import os
@@ -49,9 +49,12 @@ class Settings(BaseSettings):
     
     # Testing
     MAX_CONCURRENT_TESTS: int = 10
+    MAX_CONCURRENT_ATTACKS: int = 64
     TEST_TIMEOUT_SECONDS: int = 300
     SAVE_TEST_RESULTS: bool = True
     RESULTS_RETENTION_DAYS: int = 30
+    MAX_CACHED_REPORTS: int = 10000
+    TEST_RESULT_CACHE_SIZE: int = 128
     
     # Model Integration (Optional)
     OPENAI_API_KEY: str = ""
@@ -68,14 +71,15 @@ class Settings(BaseSettings):
     ENABLE_METRICS: bool = True
     METRICS_PORT: int = 9090
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = 'utf-8'
-        case_sensitive = True
-        extra = "allow"
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="allow",
+    )
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get cached settings instance
@@ -1,4 +1,7 @@
 # backend/app/crud.py
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
@@ -13,24 +16,35 @@ async def get_test_report(db: AsyncSession, test_id: str):
     orm_report = result.scalars().first()
     if orm_report is None:
         return None
-    # Force eager loading of all fields
-    _ = orm_report.test_id
-    _ = orm_report.start_time
-    _ = orm_report.end_time
-    _ = orm_report.total_attacks
-    _ = orm_report.successful_attacks
-    _ = orm_report.risk_score
-    _ = orm_report.recommendations
-    _ = orm_report.vulnerabilities
-    from app.schemas import TestReport
-    return TestReport.model_validate(orm_report)
+    return schemas.TestReport.model_validate(orm_report)
 
-async def get_test_reports(db: AsyncSession, skip: int = 0, limit: int = 100):
-    result = await db.execute(select(models.TestReport).offset(skip).limit(limit))
+async def get_test_reports(db: AsyncSession, skip: int = 0, limit: int = 100,
+                           after: Optional[datetime] = None, after_id: Optional[int] = None):
+    # Newest first; pass the last seen row's start_time and id as `after`/`after_id`
+    # to page by key instead of offset, which lets the start_time index seek
+    # straight to the page. start_time isn't unique, so the id breaks ties;
+    # `after` alone returns only strictly older reports.
+    query = (
+        select(models.TestReport)
+        .options(selectinload(models.TestReport.vulnerabilities))
+        .order_by(models.TestReport.start_time.desc(), models.TestReport.id.desc())
+    )
+    if after is not None:
+        older = models.TestReport.start_time < after
+        if after_id is not None:
+            older = or_(older, and_(models.TestReport.start_time == after,
+                                    models.TestReport.id < after_id))
+        query = query.filter(older)
+    else:
+        query = query.offset(skip)
+    result = await db.execute(query.limit(limit))
     return result.scalars().all()
 
 async def get_all_test_reports(db: AsyncSession):
-    result = await db.execute(select(models.TestReport))
+    result = await db.execute(
+        select(models.TestReport)
+        .options(selectinload(models.TestReport.vulnerabilities))
+    )
     return result.scalars().all()
 
 
@@ -39,12 +53,5 @@ async def create_test_report(db: AsyncSession, report: schemas.TestReportCreate)
     db_report = models.TestReport(**report.dict(exclude={"vulnerabilities"}), vulnerabilities=vulnerabilities)
     db.add(db_report)
     await db.commit()
-    # Re-query the report with all relationships loaded
-    result = await db.execute(
-        select(models.TestReport)
-        .options(selectinload(models.TestReport.vulnerabilities))
-        .filter(models.TestReport.id == db_report.id)
-    )
-    loaded_report = result.scalars().first()
-    from app.schemas import TestReport
-    return TestReport.model_validate(loaded_report)
+    # Sessions don't expire on commit, so db_report (ids included) is still loaded
+    return schemas.TestReport.model_validate(db_report)
@@ -1,15 +1,29 @@
 # backend/app/database.py
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import declarative_base
 from app.config import settings
 
 DATABASE_URL = settings.DATABASE_URL
 
 
-engine = create_async_engine(DATABASE_URL, echo=True, future=True)
+def _pool_options(url: str) -> dict:
+    # Only queue pools take sizing arguments; SQLite runs on NullPool/StaticPool
+    # (depending on the SQLAlchemy version and URL), which reject them
+    parsed = make_url(url)
+    if not issubclass(parsed.get_dialect().get_pool_class(parsed), QueuePool):
+        return {}
+    return {"pool_size": settings.DB_POOL_SIZE, "max_overflow": settings.DB_MAX_OVERFLOW}
 
-AsyncSessionLocal = sessionmaker(
-    autocommit=False, autoflush=False, bind=engine, class_=AsyncSession
+
+engine = create_async_engine(
+    DATABASE_URL, echo=settings.DEBUG, future=True, **_pool_options(DATABASE_URL)
+)
+
+# expire_on_commit=False keeps committed objects usable without re-selecting them
+AsyncSessionLocal = async_sessionmaker(
+    engine, autoflush=False, expire_on_commit=False
 )
 
 Base = declarative_base()
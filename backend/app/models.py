@@ -19,7 +19,7 @@ class TestReport(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     test_id = Column(String, unique=True, index=True, nullable=False)
-    start_time = Column(DateTime(timezone=True), server_default=func.now())
+    start_time = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     end_time = Column(DateTime(timezone=True), onupdate=func.now())
     total_attacks = Column(Integer)
     successful_attacks = Column(Integer)
@@ -41,6 +41,6 @@ class AttackResult(Base):
     detection_score = Column(Float)
     response_time_ms = Column(Float)
     timestamp = Column(DateTime(timezone=True), server_default=func.now())
-    report_id = Column(Integer, ForeignKey("test_reports.id"))
+    report_id = Column(Integer, ForeignKey("test_reports.id"), index=True)
 
     report = relationship("TestReport", back_populates="vulnerabilities")
@@ -0,0 +1,21 @@
+"""
+Shared fixtures for backend tests
+File: backend/tests/conftest.py
+"""
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+
+
+@pytest_asyncio.fixture
+async def db():
+    """Fresh in-memory SQLite session per test"""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
@@ -0,0 +1,121 @@
+"""
+Tests for the /api/v1/test endpoints
+File: backend/tests/test_api.py
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+
+PAYLOAD = {
+    "target_prompt": "You are a helpful assistant",
+    "attack_types": ["jailbreak", "prompt_injection"],
+    "intensity": "low",
+}
+
+
+@pytest.fixture
+def tester(monkeypatch):
+    """Fresh tester per test so reports and job state don't leak between tests"""
+    fresh = main.RedTeamTester()
+    monkeypatch.setattr(main, "tester", fresh)
+    return fresh
+
+
+@pytest.fixture
+def client(tester):
+    return TestClient(main.app)
+
+
+def test_post_returns_pending(client, tester):
+    # Don't let the background task finish so the job stays pending
+    async def noop(request, test_id):
+        pass
+    tester.run_test_into = noop
+
+    response = client.post("/api/v1/test", json=PAYLOAD)
+
+    assert response.status_code == 202
+    body = response.json()
+    assert body == {"test_id": body["test_id"], "status": "pending"}
+
+    poll = client.get(f"/api/v1/test/{body['test_id']}")
+    assert poll.status_code == 202
+    assert poll.json() == body
+
+
+def test_get_returns_finished_report(client, tester):
+    test_id = client.post("/api/v1/test", json=PAYLOAD).json()["test_id"]
+
+    response = client.get(f"/api/v1/test/{test_id}")
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["test_id"] == test_id
+    assert report["total_attacks"] == 10
+    assert report["vulnerabilities_found"] == report["vulnerabilities"]
+    assert tester.get_job(test_id) is None
+
+
+def test_failed_run_returns_500_with_detail(client, tester):
+    async def boom(request, test_id=None):
+        raise RuntimeError("target unreachable")
+    tester.run_test = boom
+
+    test_id = client.post("/api/v1/test", json=PAYLOAD).json()["test_id"]
+    response = client.get(f"/api/v1/test/{test_id}")
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Testing failed: target unreachable"}
+
+
+def test_unknown_test_id_returns_404(client):
+    assert client.get("/api/v1/test/missing").status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_failure_trimming_keeps_pending_jobs(tester):
+    async def boom(request, test_id=None):
+        raise RuntimeError("x")
+    tester.run_test = boom
+    tester.max_reports = 2
+
+    def submit(i):
+        return tester.submit(main.TestRequest(**{**PAYLOAD, "target_prompt": f"prompt {i}"}))
+
+    pending = [submit(i) for i in range(5)]
+    failed = [submit(i) for i in range(5, 8)]
+    for test_id in failed:
+        await tester.run_test_into(main.TestRequest(**PAYLOAD), test_id)
+
+    assert all(tester.get_job(t)["status"] == "pending" for t in pending)
+    assert tester.get_job(failed[0]) is None
+    assert [tester.get_job(t)["status"] for t in failed[1:]] == ["failed", "failed"]
+
+
+def test_post_rejected_when_at_capacity(client, tester):
+    async def noop(request, test_id):
+        pass
+    tester.run_test_into = noop
+    tester.max_pending = 2
+
+    assert [client.post("/api/v1/test", json=PAYLOAD).status_code for _ in range(3)] == [202, 202, 429]
+    assert len(tester._pending) == 2
+
+
+@pytest.mark.asyncio
+async def test_run_past_timeout_is_marked_failed(tester):
+    async def slow(request, test_id=None):
+        await asyncio.sleep(1)
+    tester.run_test = slow
+    tester.test_timeout = 0.01
+
+    test_id = tester.submit(main.TestRequest(**PAYLOAD))
+    await tester.run_test_into(main.TestRequest(**PAYLOAD), test_id)
+
+    assert tester.get_job(test_id) == {
+        "test_id": test_id, "status": "failed", "detail": "Testing failed: timed out after 0.01s",
+    }
@@ -0,0 +1,48 @@
+"""
+Tests for report CRUD helpers
+File: backend/tests/test_crud.py
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app import crud, models
+
+
+async def _add_reports(db, start_times):
+    for i, start in enumerate(start_times):
+        db.add(models.TestReport(
+            test_id=f"t{i}", start_time=start, total_attacks=0,
+            successful_attacks=0, risk_score=0.0, recommendations=[],
+        ))
+    await db.commit()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [1, 2])
+async def test_keyset_paging_covers_tied_start_times(db, limit):
+    t = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    # t0/t1 and t2/t3 share a start_time
+    await _add_reports(db, [t, t, t - timedelta(minutes=1), t - timedelta(minutes=1),
+                            t - timedelta(minutes=2)])
+
+    seen, after, after_id = [], None, None
+    while True:
+        page = await crud.get_test_reports(db, limit=limit, after=after, after_id=after_id)
+        if not page:
+            break
+        seen += [r.test_id for r in page]
+        after, after_id = page[-1].start_time, page[-1].id
+
+    assert seen == ["t1", "t0", "t3", "t2", "t4"]
+    assert seen == [r.test_id for r in await crud.get_test_reports(db)]
+
+
+@pytest.mark.asyncio
+async def test_after_without_id_returns_strictly_older(db):
+    t = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    await _add_reports(db, [t, t, t - timedelta(minutes=1)])
+
+    page = await crud.get_test_reports(db, after=t)
+    assert [r.test_id for r in page] == ["t2"]
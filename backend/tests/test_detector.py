@@ -0,0 +1,29 @@
+"""
+Tests for ToxicOutputDetector
+File: backend/tests/test_detector.py
+"""
+
+from app.enums import SeverityLevel
+from app.main import ToxicOutputDetector
+
+KEYWORDS = "kill hate murder suicide malware racist exploit illegal nsfw "
+
+
+def test_keywords_detected():
+    assert ToxicOutputDetector.analyze(KEYWORDS) == (True, 1.0, SeverityLevel.CRITICAL)
+
+
+def test_leading_filler_does_not_hide_toxic_text():
+    text = "hello " * 800 + KEYWORDS + "bye " * 200
+    assert ToxicOutputDetector.analyze(text) == (True, 1.0, SeverityLevel.CRITICAL)
+
+
+def test_window_only_scans_head_and_tail():
+    text = "hello " * 800 + KEYWORDS + "bye " * 200
+    assert ToxicOutputDetector.analyze(text, window=True) == (False, 0.0, SeverityLevel.LOW)
+    assert ToxicOutputDetector.analyze(KEYWORDS + "a " * 5000, window=True)[0]
+
+
+def test_ascii_and_unicode_paths_agree():
+    ascii_text = "the trojan can kill: self-harm"
+    assert ToxicOutputDetector.analyze(ascii_text) == ToxicOutputDetector.analyze(ascii_text + " —")
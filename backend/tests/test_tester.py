@@ -0,0 +1,89 @@
+"""
+Tests for RedTeamTester
+File: backend/tests/test_tester.py
+"""
+
+import pytest
+
+from app.config import settings
+from app.enums import AttackType
+from app.main import RedTeamTester
+from app import main
+
+
+def _request(seed=None, attack_types=("jailbreak", "prompt_injection"), intensity="low"):
+    return main.TestRequest(target_prompt="You are a helpful assistant",
+                            attack_types=list(attack_types), intensity=intensity, seed=seed)
+
+
+def _attack_ids(report):
+    return [v.attack_id for v in report.vulnerabilities]
+
+
+def test_result_cache_defaults_to_setting():
+    assert RedTeamTester().max_cached_results == settings.TEST_RESULT_CACHE_SIZE
+
+
+@pytest.mark.asyncio
+async def test_seeded_request_is_replayed_with_fresh_ids():
+    tester = RedTeamTester()
+    first = await tester.run_test(_request(seed=7))
+
+    async def fail(*args, **kwargs):
+        raise AssertionError("seeded repeat should be replayed, not re-run")
+    tester._run_attack_type = fail
+    second = await tester.run_test(_request(seed=7))
+
+    assert _attack_ids(first) and _attack_ids(second) == _attack_ids(first)
+    assert second.test_id != first.test_id
+    assert second.id == first.id + 1
+    assert all(v.report_id == second.id for v in second.vulnerabilities)
+    assert tester.get_report(first.test_id) is first
+    assert tester.get_report(second.test_id) is second
+
+
+@pytest.mark.asyncio
+async def test_same_seed_same_attacks_without_cache():
+    first = await RedTeamTester().run_test(_request(seed=7))
+    second = await RedTeamTester().run_test(_request(seed=7))
+    assert _attack_ids(second) == _attack_ids(first)
+
+
+@pytest.mark.asyncio
+async def test_result_cache_evicts_least_recently_used():
+    tester = RedTeamTester(max_cached_results=2)
+    for seed in (1, 2):
+        await tester.run_test(_request(seed=seed))
+    await tester.run_test(_request(seed=1))  # hit: seed 1 becomes most recent
+    await tester.run_test(_request(seed=3))
+
+    assert len(tester._result_cache) == 2
+    assert tester._result_cache_key(_request(seed=1)) in tester._result_cache
+    assert tester._result_cache_key(_request(seed=2)) not in tester._result_cache
+    assert tester._result_cache_key(_request(seed=3)) in tester._result_cache
+
+
+@pytest.mark.asyncio
+async def test_unseeded_requests_are_not_cached():
+    tester = RedTeamTester()
+    await tester.run_test(_request())
+    assert not tester._result_cache
+
+
+@pytest.mark.asyncio
+async def test_repeated_attack_type_gets_distinct_payloads():
+    tester = RedTeamTester()
+    request = _request(seed=7, attack_types=["jailbreak", "jailbreak"], intensity="high")
+    first = await tester._run_attack_type(AttackType.JAILBREAK, request, 0)
+    second = await tester._run_attack_type(AttackType.JAILBREAK, request, 1)
+    assert [r.attack_id for r in first] != [r.attack_id for r in second]
+
+
+@pytest.mark.asyncio
+async def test_fuzz_payloads_capped_at_setting_and_still_flagged(monkeypatch):
+    monkeypatch.setattr(settings, "MAX_ATTACK_PAYLOAD_LENGTH", 6000)
+    payloads = main.BehaviorFuzzer.generate("x" * 700, "high")
+    assert max(map(len, payloads)) == 6000
+
+    results = await RedTeamTester()._test_fuzzing(payloads)
+    assert all(r.success for p, r in zip(payloads, results) if len(p) == 6000)
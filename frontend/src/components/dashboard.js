@@ -17,6 +17,9 @@ const AIRedTeamDashboard = () => {
   });
 
   const API_BASE_URL = process.env.REACT_APP_API_URL || 'http://localhost:8000';
+  // Matches the backend's TEST_TIMEOUT_SECONDS; polling gives up a little after it
+  const TEST_TIMEOUT_SECONDS = Number(process.env.REACT_APP_TEST_TIMEOUT_SECONDS) || 300;
+  const POLL_INTERVAL_MS = 500;
 
   // Call actual FastAPI backend
   const runSecurityTest = async () => {
@@ -34,8 +37,26 @@ const AIRedTeamDashboard = () => {
       if (!response.ok) {
         throw new Error(`HTTP error! status: ${response.status}`);
       }
-      
-      const result = await response.json();
+
+      // The test runs in the background; poll until the report is ready
+      const { test_id } = await response.json();
+      const deadline = Date.now() + (TEST_TIMEOUT_SECONDS + 10) * 1000;
+      let result;
+      while (!result) {
+        if (Date.now() > deadline) {
+          const timeoutError = new Error(`Test ${test_id} did not finish within ${TEST_TIMEOUT_SECONDS}s`);
+          timeoutError.timedOut = true;
+          throw timeoutError;
+        }
+        await new Promise(resolve => setTimeout(resolve, POLL_INTERVAL_MS));
+        const poll = await fetch(`${API_BASE_URL}/api/v1/test/${test_id}`);
+        if (!poll.ok) {
+          throw new Error(`HTTP error! status: ${poll.status}`);
+        }
+        if (poll.status === 200) {
+          result = await poll.json();
+        }
+      }
       setTestResults(result);
       
       // Update stats
@@ -48,7 +69,9 @@ const AIRedTeamDashboard = () => {
       setActiveTab('results');
     } catch (error) {
       console.error('Test failed:', error);
-      alert('Failed to run security test. Make sure the backend is running on ' + API_BASE_URL);
+      alert(error.timedOut
+        ? 'Security test timed out. ' + error.message + '.'
+        : 'Failed to run security test. Make sure the backend is running on ' + API_BASE_URL);
     } finally {
       setLoading(false);
     }